@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import html
 import os
 import sys
 from pathlib import Path
@@ -11,6 +12,8 @@ import streamlit as st
 ROOT_DIR = Path(__file__).parent
 LATEST_SCAN_PATH = ROOT_DIR / "data" / "latest.json"
 HISTORY_PATH = ROOT_DIR / "data" / "history.jsonl"
+HISTORY_DISPLAY_LIMIT = 50
+TABLE_DISPLAY_LIMIT = 500
 DB_PATH = ROOT_DIR / "ebayflip.sqlite"
 
 # Ensure package is importable
@@ -22,6 +25,7 @@ from ebayflip.env import load_dotenv
 load_dotenv(ROOT_DIR / ".env")
 
 from ebayflip.dashboard_data import (
+    file_signature,
     filter_items,
     history_summary_rows,
     items_to_csv_bytes,
@@ -49,6 +53,52 @@ try:
 except ImportError:
     pass
 
+
+# Keyed on (path, mtime_ns, size) so reruns only re-parse after the scanner rewrites the file.
+# cache_resource hands back the same object instead of unpickling a copy per rerun; callers only read it.
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_latest_scan_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any] | None:
+    return load_latest_scan(Path(path_str))
+
+
+def _load_latest_scan() -> dict[str, Any] | None:
+    signature = file_signature(LATEST_SCAN_PATH)
+    if signature is None:
+        return None
+    return _load_latest_scan_cached(str(LATEST_SCAN_PATH), *signature)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _history_frames_cached(path_str: str, mtime_ns: int, size: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    history = load_history(Path(path_str), limit=HISTORY_DISPLAY_LIMIT)
+    table_df = pd.DataFrame(history_summary_rows(history, limit=HISTORY_DISPLAY_LIMIT))
+    chart_df = pd.DataFrame(
+        [
+            {
+                "scan": entry.get("generated_at", "")[:16],
+                "Deals": (entry.get("scan_summary") or {}).get("deals", 0),
+            }
+            for entry in history
+        ]
+    )
+    if len(chart_df) > 1:
+        chart_df = chart_df.set_index("scan")
+    return table_df, chart_df
+
+
+def _history_frames() -> tuple[pd.DataFrame, pd.DataFrame] | None:
+    signature = file_signature(HISTORY_PATH)
+    if signature is None:
+        return None
+    return _history_frames_cached(str(HISTORY_PATH), *signature)
+
+
+# The environment is loaded once at start-up and the dashboard only reads these settings.
+@st.cache_resource(show_spinner=False)
+def _run_settings() -> RunSettings:
+    return RunSettings.from_env()
+
+
 def _inject_styles() -> None:
     st.markdown(
         """
@@ -169,9 +219,9 @@ def _render_zero_result_diagnostics(items: list[dict[str, Any]], scan_summary: d
     zero_result_targets = scan_summary.get("zero_result_targets") or []
     if not zero_result_targets:
         return
-    blocked_count = sum(1 for zrt in zero_result_targets if zrt.get("blocked_reason"))
+    any_blocked = any(zrt.get("blocked_reason") for zrt in zero_result_targets)
     with st.expander(f"Targets with no results ({len(zero_result_targets)})", expanded=not items):
-        if blocked_count:
+        if any_blocked:
             st.warning(
                 "Some targets look blocked by anti-bot checks. If this persists, try waiting, enabling Playwright "
                 "(`EBAY_USE_PLAYWRIGHT=1`), or switching buy marketplace (`MARKETPLACE=mercari`)."
@@ -196,7 +246,7 @@ def _render_zero_result_diagnostics(items: list[dict[str, Any]], scan_summary: d
 
 def _render_strategy_controls() -> dict[str, Any]:
     target_profit_default = float(os.getenv("FLIP_TARGET_PROFIT", "20"))
-    run_defaults = RunSettings.from_env()
+    run_defaults = _run_settings()
     strategy_col1, strategy_col2, strategy_col3, strategy_col4 = st.columns([1.2, 1, 1, 1])
     with strategy_col1:
         target_profit = st.number_input(
@@ -283,6 +333,45 @@ def _render_strategy_controls() -> dict[str, Any]:
     }
 
 
+def _scored_items(payload: dict[str, Any], controls: dict[str, Any]) -> list[dict[str, Any]]:
+    # Widget reruns that leave the scan and the deal thresholds alone reuse the last scoring pass.
+    key = (
+        payload.get("generated_at"),
+        controls["target_profit"],
+        controls["deal_min_profit"],
+        controls["deal_min_roi"],
+        controls["deal_min_confidence"],
+    )
+    cached = st.session_state.get("_scored_items")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    items = enrich_items(
+        sort_items(payload.get("items") or []),
+        _run_settings(),
+        target_profit_gbp=controls["target_profit"],
+    )
+    deal_min_profit = float(controls["deal_min_profit"])
+    deal_min_roi = float(controls["deal_min_roi"])
+    deal_min_confidence = float(controls["deal_min_confidence"])
+    # Re-label items in the UI based on the thresholds the user picked.
+    for item in items:
+        item["decision_model"] = item.get("decision")
+        profit = float(item.get("expected_profit_gbp") or 0.0)
+        roi = float(item.get("roi") or 0.0)
+        confidence = float(item.get("confidence") or 0.0)
+        if profit >= deal_min_profit and roi >= deal_min_roi and confidence >= deal_min_confidence:
+            item["decision"] = "deal"
+        elif profit >= 0 and roi >= 0.10 and confidence >= 0.35:
+            item["decision"] = "maybe"
+        else:
+            item["decision"] = "ignore"
+        edge = float(item.get("buy_edge_gbp") or 0.0)
+        item["is_actionable"] = edge > 0 and profit > 0 and confidence >= deal_min_confidence
+    st.session_state["_scored_items"] = (key, items)
+    return items
+
+
 def _render_filter_controls(items: list[dict[str, Any]]) -> dict[str, Any]:
     filter_col1, filter_col2, filter_col3, filter_col4, filter_col5 = st.columns([1, 2, 1, 1, 1.2])
     with filter_col1:
@@ -296,7 +385,7 @@ def _render_filter_controls(items: list[dict[str, Any]]) -> dict[str, Any]:
     with filter_col5:
         st.download_button(
             label="Export CSV",
-            data=items_to_csv_bytes(items),
+            data=lambda: items_to_csv_bytes(items),
             file_name="keyflip_scan.csv",
             mime="text/csv",
         )
@@ -335,6 +424,32 @@ def _to_display_dataframe(items: list[dict[str, Any]]) -> pd.DataFrame:
     return pd.DataFrame(rows)
 
 
+def _display_frame(items: list[dict[str, Any]]) -> tuple[pd.DataFrame, dict[int, int]]:
+    # Rows are formatted once per scoring pass; filter reruns only pick positions out of this frame.
+    cached = st.session_state.get("_display_frame")
+    if cached is not None and cached[0] is items:
+        return cached[1], cached[2]
+    frame = _to_display_dataframe(items)
+    positions = {id(item): position for position, item in enumerate(items)}
+    st.session_state["_display_frame"] = (items, frame, positions)
+    return frame, positions
+
+
+def _filtered_view(
+    items: list[dict[str, Any]], filters: dict[str, Any]
+) -> tuple[list[dict[str, Any]], pd.DataFrame]:
+    # Reruns from widgets outside the filters (budget, cards, auto-refresh) reuse the last view.
+    key = tuple(filters.items())
+    cached = st.session_state.get("_filtered_view")
+    if cached is not None and cached[0] is items and cached[1] == key:
+        return cached[2], cached[3]
+    filtered_items = filter_items(items, **filters)
+    frame, positions = _display_frame(items)
+    view = frame.take([positions[id(item)] for item in filtered_items[:TABLE_DISPLAY_LIMIT]])
+    st.session_state["_filtered_view"] = (items, key, filtered_items, view)
+    return filtered_items, view
+
+
 def _render_portfolio_plan(filtered_items: list[dict[str, Any]], bankroll_gbp: float, max_planned_picks: int) -> None:
     portfolio = plan_portfolio(
         filtered_items,
@@ -385,12 +500,13 @@ def _render_flip_card(item: dict[str, Any]) -> None:
 
     col_left, col_right = st.columns([3.2, 1.2])
     with col_left:
-        st.markdown(f'<span class="deal-tag {tag_class}">{decision.upper()}</span>', unsafe_allow_html=True)
-        st.markdown(f"**{title[:100]}**")
         profit_str = f"Profit: **{_format_gbp(profit)}**" if profit is not None else "Profit: -"
-        location_str = f" | Location: {location}" if location else ""
-        st.markdown(f"Buy: **{_format_gbp(buy)}** | Resale: **{_format_gbp(resale)}** | {profit_str}{location_str}")
+        location_str = f" | Location: {html.escape(str(location))}" if location else ""
+        # One markdown element per card instead of four; listing text is escaped since the block allows HTML.
         st.markdown(
+            f'<span class="deal-tag {tag_class}">{decision.upper()}</span>\n\n'
+            f"**{html.escape(title[:100])}**\n\n"
+            f"Buy: **{_format_gbp(buy)}** | Resale: **{_format_gbp(resale)}** | {profit_str}{location_str}\n\n"
             f'<span class="insight-chip">Grade {grade}</span>'
             f'<span class="{risk_chip_class}">Risk {risk}</span>'
             f'<span class="insight-chip">Max Buy {_format_gbp(max_buy)}</span>'
@@ -420,62 +536,76 @@ def _render_flip_card(item: dict[str, Any]) -> None:
 
 def _render_history_tab() -> None:
     st.subheader("Scan History")
-    history = load_history(HISTORY_PATH)
-    if not history:
+    frames = _history_frames()
+    if frames is None or frames[0].empty:
         st.info("No scan history yet. History builds up after multiple scans.")
         return
 
-    history_rows = history_summary_rows(history, limit=50)
-    st.dataframe(pd.DataFrame(history_rows), use_container_width=True, hide_index=True)
+    table_df, chart_df = frames
+    st.dataframe(table_df, use_container_width=True, hide_index=True)
+
+    st.subheader("Deals Over Time")
+    if len(chart_df) > 1:
+        st.line_chart(chart_df)
+
+
+@st.cache_resource(show_spinner=False)
+def _init_targets_db(db_path: str) -> str:
+    from ebayflip.db import init_db
+
+    init_db(db_path)
+    return db_path
 
-    chart_data = []
-    for entry in history[-50:]:
-        summary = entry.get("scan_summary") or {}
-        chart_data.append(
+
+# WAL commits land in the -wal file first, so both signatures are part of the key.
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _targets_frame_cached(
+    db_path: str,
+    db_signature: tuple[int, int] | None,
+    wal_signature: tuple[int, int] | None,
+) -> pd.DataFrame:
+    from ebayflip.db import list_targets
+
+    return pd.DataFrame(
+        [
             {
-                "scan": entry.get("generated_at", "")[:16],
-                "Deals": summary.get("deals", 0),
-                "Items": entry.get("count", 0),
+                "Status": "ON" if target.enabled else "OFF",
+                "Name": target.name,
+                "ID": target.id,
+                "Query": target.query,
+                "Category": target.category_id or "-",
+                "Condition": target.condition or "Any",
+                "Max Buy": _format_gbp(target.max_buy_gbp) if target.max_buy_gbp else "No limit",
+                "Max Shipping": _format_gbp(target.shipping_max_gbp) if target.shipping_max_gbp else "No limit",
+                "Country": target.country,
+                "Created": target.created_at,
             }
-        )
-    if chart_data:
-        st.subheader("Deals Over Time")
-        chart_df = pd.DataFrame(chart_data)
-        if len(chart_df) > 1:
-            chart_df = chart_df.set_index("scan")
-            st.line_chart(chart_df[["Deals"]])
+            for target in list_targets(db_path)
+        ]
+    )
+
+
+def _targets_frame() -> pd.DataFrame:
+    db_path = _init_targets_db(str(DB_PATH))
+    return _targets_frame_cached(
+        db_path,
+        file_signature(DB_PATH),
+        file_signature(Path(f"{db_path}-wal")),
+    )
 
 
 def _render_targets_tab() -> None:
     st.subheader("Automatic Targets")
     st.caption("Targets are managed automatically by scanner discovery and popular-category seeding.")
     try:
-        from ebayflip.db import init_db, list_targets
-
-        db_path = str(DB_PATH)
-        init_db(db_path)
-        targets = list_targets(db_path)
-        if not targets:
+        frame = _targets_frame()
+        if frame.empty:
             st.info(
                 "No targets yet. Run `python scanner/run_scan.py --watch` and the scanner will auto-seed targets."
             )
-
-        if targets:
-            st.caption(f"{len(targets)} auto-managed target(s) configured")
-            for target in targets:
-                with st.expander(f"{'[ON]' if target.enabled else '[OFF]'} {target.name}"):
-                    st.text(f"ID: {target.id}")
-                    st.text(f"Query: {target.query}")
-                    st.text(f"Category: {target.category_id or '-'}")
-                    st.text(f"Condition: {target.condition or 'Any'}")
-                    st.text(f"Max Buy: {_format_gbp(target.max_buy_gbp)}" if target.max_buy_gbp else "Max Buy: No limit")
-                    st.text(
-                        f"Max Shipping: {_format_gbp(target.shipping_max_gbp)}"
-                        if target.shipping_max_gbp
-                        else "Max Shipping: No limit"
-                    )
-                    st.text(f"Country: {target.country}")
-                    st.text(f"Created: {target.created_at}")
+        else:
+            st.caption(f"{len(frame)} auto-managed target(s) configured")
+            st.dataframe(frame, use_container_width=True, hide_index=True)
         st.divider()
         st.caption(
             "Automatic behavior is controlled from environment variables: "
@@ -496,7 +626,7 @@ tab_dashboard, tab_history, tab_targets = st.tabs(["Dashboard", "Scan History",
 
 # ======== DASHBOARD TAB ========
 with tab_dashboard:
-    payload = load_latest_scan(LATEST_SCAN_PATH)
+    payload = _load_latest_scan()
     auto_started = start_background_scan_if_needed(payload)
     status = scan_run_status()
     scan_col1, scan_col2, scan_col3 = st.columns([1.2, 1, 2.2])
@@ -520,32 +650,8 @@ with tab_dashboard:
         else:
             st.info("No scan data yet. Click **Run scan now** to populate the dashboard.")
     else:
-        run_settings = RunSettings.from_env()
         controls = _render_strategy_controls()
-
-        items = enrich_items(
-            sort_items(payload.get("items") or []),
-            run_settings,
-            target_profit_gbp=controls["target_profit"],
-        )
-        # Re-label items in the UI based on the thresholds the user picked above.
-        for item in items:
-            item["decision_model"] = item.get("decision")
-            profit = float(item.get("expected_profit_gbp") or 0.0)
-            roi = float(item.get("roi") or 0.0)
-            confidence = float(item.get("confidence") or 0.0)
-            if (
-                profit >= float(controls["deal_min_profit"])
-                and roi >= float(controls["deal_min_roi"])
-                and confidence >= float(controls["deal_min_confidence"])
-            ):
-                item["decision"] = "deal"
-            elif profit >= 0 and roi >= 0.10 and confidence >= 0.35:
-                item["decision"] = "maybe"
-            else:
-                item["decision"] = "ignore"
-            edge = float(item.get("buy_edge_gbp") or 0.0)
-            item["is_actionable"] = edge > 0 and profit > 0 and confidence >= float(controls["deal_min_confidence"])
+        items = _scored_items(payload, controls)
         scan_summary = payload.get("scan_summary") or {}
         summary = summarize_items(items)
         actionable_count = sum(1 for item in items if item.get("is_actionable"))
@@ -575,24 +681,27 @@ with tab_dashboard:
             st.subheader("Flip Opportunities")
             filter_controls = _render_filter_controls(items)
 
-            filtered_items = filter_items(
+            filtered_items, frame = _filtered_view(
                 items,
-                decision=filter_controls["filter_decision"],
-                search_term=filter_controls["search_term"],
-                min_score=filter_controls["min_score"],
-                min_profit=filter_controls["min_profit"] if filter_controls["min_profit"] > 0 else None,
+                {
+                    "decision": filter_controls["filter_decision"],
+                    "search_term": filter_controls["search_term"],
+                    "min_score": filter_controls["min_score"],
+                    "min_profit": filter_controls["min_profit"] if filter_controls["min_profit"] > 0 else None,
+                    "min_confidence": controls["min_confidence_filter"],
+                    "actionable_only": controls["actionable_only"],
+                },
             )
-            filtered_items = [
-                item for item in filtered_items if (item.get("confidence") or 0.0) >= controls["min_confidence_filter"]
-            ]
-            if controls["actionable_only"]:
-                filtered_items = [item for item in filtered_items if item.get("is_actionable")]
 
             if not filtered_items:
                 st.info("No listings match current filters. Lower min score/profit or confidence to widen results.")
 
-            frame = _to_display_dataframe(filtered_items)
             st.dataframe(frame, use_container_width=True, hide_index=True)
+            if len(filtered_items) > TABLE_DISPLAY_LIMIT:
+                st.caption(
+                    f"Showing the top {TABLE_DISPLAY_LIMIT} of {len(filtered_items)} matching listings. "
+                    f"Export CSV downloads all {len(items)} scan items, ignoring these filters."
+                )
 
             _render_portfolio_plan(
                 filtered_items,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -30,11 +31,31 @@ class CacheStore:
     def __init__(self, path: str, ttl_seconds: int = 600) -> None:
         self.path = path
         self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per thread; `with conn:` only commits, so it stays open for the next lookup.
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        conn = sqlite3.connect(self.path, timeout=15)
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            conn.close()
+
     def _init_db(self) -> None:
         Path(self.path).parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.path) as conn:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS http_cache (
@@ -49,7 +70,7 @@ class CacheStore:
 
     def get(self, key: str) -> Optional[CachedResponse]:
         now = time.time()
-        with sqlite3.connect(self.path) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT response_text, status_code, headers_json, created_at FROM http_cache WHERE cache_key = ?",
                 (key,),
@@ -64,7 +85,7 @@ class CacheStore:
         return CachedResponse(text=row[0], status_code=row[1], headers=headers)
 
     def set(self, key: str, response: requests.Response) -> None:
-        with sqlite3.connect(self.path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO http_cache
@@ -81,7 +102,7 @@ class CacheStore:
             )
 
     def delete(self, key: str) -> None:
-        with sqlite3.connect(self.path) as conn:
+        with self._connect() as conn:
             conn.execute("DELETE FROM http_cache WHERE cache_key = ?", (key,))
 
     def purge_blocked_responses(self, tokens: list[str]) -> int:
@@ -92,6 +113,6 @@ class CacheStore:
             return 0
         where_clause = " OR ".join("LOWER(response_text) LIKE ?" for _ in normalized)
         params = tuple(f"%{token}%" for token in normalized)
-        with sqlite3.connect(self.path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(f"DELETE FROM http_cache WHERE {where_clause}", params)
             return int(cursor.rowcount or 0)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import csv
-import io
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 import os
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+_TAIL_BLOCK_SIZE = 64 * 1024
 DECISION_ORDER = {"deal": 0, "maybe": 1, "ignore": 2}
 CSV_FIELDS = [
     "decision",
@@ -33,11 +38,19 @@ CSV_FIELDS = [
 ]
 
 
+def _loads(text: str) -> Any:
+    # orjson is an optional speed-up; the stdlib still decides anything it rejects (e.g. NaN literals).
+    if _orjson is not None:
+        try:
+            return _orjson.loads(text)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 def load_latest_scan(path: Path) -> dict[str, Any] | None:
-    if not path.exists():
-        return None
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = _loads(path.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError):
         return None
     if os.getenv("DROP_BLOCKED_TARGETS", "1").strip().lower() in {"1", "true", "yes", "y", "on"}:
@@ -52,21 +65,49 @@ def load_latest_scan(path: Path) -> dict[str, Any] | None:
     return payload
 
 
-def load_history(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
+def file_signature(path: Path) -> Optional[tuple[int, int]]:
+    # (mtime_ns, size) changes whenever the file is rewritten; callers key their parse memos on it.
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_tail_lines(path: Path, limit: int) -> list[str]:
+    # Walk back from EOF in blocks until enough newlines are buffered; the scanner only ever appends.
+    with path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        data = b""
+        while position > 0 and data.count(b"\n") <= limit:
+            step = min(_TAIL_BLOCK_SIZE, position)
+            position -= step
+            handle.seek(position)
+            data = handle.read(step) + data
+    if position > 0:
+        data = data[data.find(b"\n") + 1 :]
+    return data.decode("utf-8").splitlines()[-limit:]
+
+
+def load_history(path: Path, *, limit: Optional[int] = None) -> list[dict[str, Any]]:
+    if limit is not None and limit <= 0:
         return []
     entries: list[dict[str, Any]] = []
     try:
-        for line in path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    except OSError:
+        if limit is None:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        else:
+            lines = read_tail_lines(path, limit)
+    except (OSError, UnicodeDecodeError):
         return []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entries.append(_loads(line))
+        except json.JSONDecodeError:
+            continue
     return entries
 
 
@@ -81,14 +122,24 @@ def sort_items(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
 
 
 def summarize_items(items: list[dict[str, Any]]) -> dict[str, Any]:
-    deal_count = sum(1 for item in items if item.get("decision") == "deal")
-    maybe_count = sum(1 for item in items if item.get("decision") == "maybe")
-    total_profit = sum(
-        item.get("expected_profit_gbp", 0)
-        for item in items
-        if item.get("decision") in ("deal", "maybe") and (item.get("expected_profit_gbp") or 0) > 0
-    )
-    best_score = max((item.get("deal_score") or 0.0 for item in items), default=0.0)
+    deal_count = 0
+    maybe_count = 0
+    total_profit = 0
+    best_score = (items[0].get("deal_score") or 0.0) if items else 0.0
+    for item in items:
+        score = item.get("deal_score") or 0.0
+        if score > best_score:
+            best_score = score
+        decision = item.get("decision")
+        if decision == "deal":
+            deal_count += 1
+        elif decision == "maybe":
+            maybe_count += 1
+        else:
+            continue
+        profit = item.get("expected_profit_gbp") or 0
+        if profit > 0:
+            total_profit += profit
     return {
         "deal_count": deal_count,
         "maybe_count": maybe_count,
@@ -105,30 +156,46 @@ def filter_items(
     search_term: str = "",
     min_score: float = 0.0,
     min_profit: Optional[float] = None,
+    min_confidence: Optional[float] = None,
+    actionable_only: bool = False,
 ) -> list[dict[str, Any]]:
-    filtered = items
-    if decision != "All":
-        filtered = [item for item in filtered if item.get("decision") == decision]
-    if search_term:
-        search_lower = search_term.lower().strip()
-        filtered = [item for item in filtered if search_lower in (item.get("title") or "").lower()]
-    if min_score > 0:
-        filtered = [item for item in filtered if (item.get("deal_score") or 0.0) >= min_score]
-    if min_profit is not None:
-        filtered = [item for item in filtered if (item.get("expected_profit_gbp") or 0.0) >= min_profit]
+    search_lower = search_term.lower().strip()
+    # One pass with early rejection instead of a list rebuild per active filter.
+    filtered = []
+    for item in items:
+        if decision != "All" and item.get("decision") != decision:
+            continue
+        if search_lower and search_lower not in (item.get("title") or "").lower():
+            continue
+        if min_score > 0 and (item.get("deal_score") or 0.0) < min_score:
+            continue
+        if min_profit is not None and (item.get("expected_profit_gbp") or 0.0) < min_profit:
+            continue
+        if min_confidence is not None and (item.get("confidence") or 0.0) < min_confidence:
+            continue
+        if actionable_only and not item.get("is_actionable"):
+            continue
+        filtered.append(item)
     return filtered
 
 
-def items_to_csv_bytes(items: list[dict[str, Any]]) -> bytes:
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=CSV_FIELDS, extrasaction="ignore")
-    writer.writeheader()
+class _PassthroughWriter:
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_items_csv(items: list[dict[str, Any]]) -> Iterator[str]:
+    # csv.writer returns whatever write() returns, so each row is yielded as soon as it is formatted.
+    writer = csv.DictWriter(_PassthroughWriter(), fieldnames=CSV_FIELDS)
+    yield writer.writeheader()
     for item in items:
-        row = dict(item)
-        reasons = row.get("reasons") or []
-        row["reasons"] = "; ".join(str(reason) for reason in reasons)
-        writer.writerow(row)
-    return output.getvalue().encode("utf-8")
+        row = {field: item.get(field) for field in CSV_FIELDS}
+        row["reasons"] = "; ".join(str(reason) for reason in item.get("reasons") or [])
+        yield writer.writerow(row)
+
+
+def items_to_csv_bytes(items: list[dict[str, Any]]) -> bytes:
+    return "".join(iter_items_csv(items)).encode("utf-8")
 
 
 def history_summary_rows(history: list[dict[str, Any]], *, limit: int = 50) -> list[dict[str, Any]]:
@@ -16,8 +16,13 @@ LOGGER = get_logger()
 def get_connection(db_path: str) -> Iterable[sqlite3.Connection]:
     conn = sqlite3.connect(db_path, timeout=15)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA busy_timeout=5000")
+    # journal_mode is stored in the database file: reading it is cheap, and only a new or reset file
+    # needs the switch to WAL, which takes a lock. synchronous is per connection; under WAL, NORMAL
+    # stays durable at checkpoints and skips the per-commit fsync.
+    if conn.execute("PRAGMA journal_mode").fetchone()[0].lower() != "wal":
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
     try:
         yield conn
         conn.commit()
@@ -143,6 +148,9 @@ def init_db(db_path: str) -> None:
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_evaluations_listing ON evaluations(listing_id)"
         )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_evaluations_evaluated_at ON evaluations(evaluated_at)"
+        )
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_comps_listing ON comps(listing_id)"
         )
@@ -380,10 +388,13 @@ def list_listings(db_path: str) -> list[Listing]:
     return [Listing.from_row(row) for row in rows]
 
 
-def list_evaluations_with_listings(db_path: str) -> list[dict]:
+def list_evaluations_with_listings(db_path: str, *, since: Optional[str] = None) -> list[dict]:
+    # evaluated_at is a UTC isoformat() string, so text comparison follows time order.
+    where_clause = "WHERE e.evaluated_at >= ?" if since is not None else ""
+    params = (since,) if since is not None else ()
     with get_connection(db_path) as conn:
         rows = conn.execute(
-            """
+            f"""
             SELECT
                 e.id AS evaluation_id,
                 e.listing_id,
@@ -407,11 +418,13 @@ def list_evaluations_with_listings(db_path: str) -> list[dict]:
                 l.listing_type,
                 l.start_time,
                 l.end_time,
-                l.raw_json
+                CASE WHEN json_valid(l.raw_json) THEN json_extract(l.raw_json, '$.source') END AS source
             FROM evaluations e
             JOIN listings l ON l.id = e.listing_id
+            {where_clause}
             ORDER BY e.evaluated_at DESC
-            """
+            """,
+            params,
         ).fetchall()
     return [dict(row) for row in rows]
 
@@ -1,7 +1,9 @@
 ﻿from __future__ import annotations
 
 import dataclasses
+import functools
 import hashlib
+import importlib.metadata
 import importlib.util
 import json
 import os
@@ -11,10 +13,11 @@ import subprocess
 import sys
 import time
 import threading
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import requests
@@ -40,6 +43,7 @@ CRAIGSLIST_SEARCH_URL_TEMPLATE = "https://{site}.craigslist.org/search/sss"
 MERCARI_SEARCH_URL = "https://www.mercari.com/search/"
 POSHMARK_SEARCH_URL = "https://poshmark.com/search"
 DEFAULT_PLAYWRIGHT_BROWSERS_PATH = "/tmp/pw-browsers"
+PLAYWRIGHT_READY_MARKER = ".keyflip_chromium"
 USER_AGENTS = [
     (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -1487,6 +1491,7 @@ def _needs_bot_retry(response: requests.Response, failure_mode: Optional[str]) -
     return False
 
 
+@functools.lru_cache(maxsize=1)
 def _accept_encoding_header() -> str:
     encodings = ["gzip", "deflate"]
     if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
@@ -1502,9 +1507,13 @@ def _set_playwright_env_defaults() -> str:
     return path
 
 
-_set_playwright_env_defaults()
+_PLAYWRIGHT_BROWSERS_PATH = _set_playwright_env_defaults()
+_PLAYWRIGHT_INSTALL_LOCK = threading.Lock()
+_PLAYWRIGHT_BROWSERS_READY = False
+_PLAYWRIGHT_SESSION = threading.local()
 
 
+@functools.lru_cache(maxsize=1)
 def _playwright_available() -> bool:
     try:
         return importlib.util.find_spec("playwright.sync_api") is not None
@@ -1519,24 +1528,92 @@ def _playwright_fallback_enabled(settings: RunSettings) -> bool:
     return raw_value.strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
-def _ensure_playwright_browsers_installed() -> bool:
-    if not _playwright_available():
-        LOGGER.warning("Playwright not installed; skipping browser fallback.")
+def _browsers_dir_populated(path: str) -> bool:
+    # One getdents via scandir; an empty or missing directory skips the driver start-up.
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except OSError:
         return False
-    _set_playwright_env_defaults()
+
+
+def _ready_marker_path() -> Optional[Path]:
+    if _PLAYWRIGHT_BROWSERS_PATH == "0":
+        return None
+    return Path(_PLAYWRIGHT_BROWSERS_PATH) / PLAYWRIGHT_READY_MARKER
+
+
+def _playwright_version() -> Optional[str]:
     try:
-        from playwright.sync_api import sync_playwright
-    except Exception as exc:
-        LOGGER.warning("Playwright import failed: %s", exc)
+        return importlib.metadata.version("playwright")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _ready_marker_valid() -> bool:
+    # Each scanner run is a fresh process; the marker lets it skip starting the Playwright driver.
+    # It records the Playwright version too: an upgrade needs a new Chromium revision even though
+    # the old one is still on disk.
+    marker = _ready_marker_path()
+    if marker is None:
         return False
-    browser_path: Optional[Path] = None
+    try:
+        version, _, executable = marker.read_text(encoding="utf-8").strip().partition("\n")
+    except OSError:
+        return False
+    if not executable or version != _playwright_version():
+        return False
+    return Path(executable).exists()
+
+
+def _write_ready_marker(executable: Path) -> None:
+    marker = _ready_marker_path()
+    if marker is None:
+        return
+    try:
+        marker.write_text(f"{_playwright_version()}\n{executable}", encoding="utf-8")
+    except OSError:
+        LOGGER.debug("Could not record Playwright readiness in %s", marker)
+
+
+def _ensure_playwright_browsers_installed() -> bool:
+    global _PLAYWRIGHT_BROWSERS_READY
+    if _PLAYWRIGHT_BROWSERS_READY:
+        return True
+    # Parallel scan workers share one check so only a single install can run at a time.
+    with _PLAYWRIGHT_INSTALL_LOCK:
+        if not _PLAYWRIGHT_BROWSERS_READY:
+            _PLAYWRIGHT_BROWSERS_READY = _detect_or_install_playwright_browsers()
+        return _PLAYWRIGHT_BROWSERS_READY
+
+
+def _probe_chromium_executable(sync_playwright: Any) -> Optional[Path]:
     try:
         with sync_playwright() as playwright:
             browser_path = Path(playwright.chromium.executable_path)
     except Exception as exc:
         LOGGER.warning("Playwright browser detection failed: %s", exc)
-    if browser_path and browser_path.exists():
+        return None
+    return browser_path if browser_path.exists() else None
+
+
+def _detect_or_install_playwright_browsers() -> bool:
+    if not _playwright_available():
+        LOGGER.warning("Playwright not installed; skipping browser fallback.")
+        return False
+    if _ready_marker_valid():
         return True
+    try:
+        from playwright.sync_api import sync_playwright
+    except Exception as exc:
+        LOGGER.warning("Playwright import failed: %s", exc)
+        return False
+    # "0" tells Playwright to keep browsers inside the package, so only probe real directories.
+    if _PLAYWRIGHT_BROWSERS_PATH == "0" or _browsers_dir_populated(_PLAYWRIGHT_BROWSERS_PATH):
+        browser_path = _probe_chromium_executable(sync_playwright)
+        if browser_path is not None:
+            _write_ready_marker(browser_path)
+            return True
     install_cmd = [sys.executable, "-m", "playwright", "install", "chromium"]
     LOGGER.info("Installing Playwright browsers with %s", " ".join(install_cmd))
     try:
@@ -1551,6 +1628,10 @@ def _ensure_playwright_browsers_installed() -> bool:
             LOGGER.info("Playwright install stdout: %s", result.stdout.strip())
         if result.stderr:
             LOGGER.info("Playwright install stderr: %s", result.stderr.strip())
+        # Record the fresh install so the next scanner process skips the driver probe.
+        browser_path = _probe_chromium_executable(sync_playwright)
+        if browser_path is not None:
+            _write_ready_marker(browser_path)
         return True
     except subprocess.CalledProcessError as exc:
         LOGGER.error(
@@ -1832,6 +1913,59 @@ def _should_fallback_to_playwright(
     return False
 
 
+def _launch_chromium(playwright: Any) -> Any:
+    launch_args = [
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+    ]
+    if os.getenv("EBAY_NO_SANDBOX") == "1":
+        launch_args.extend(["--no-sandbox", "--disable-setuid-sandbox"])
+    return playwright.chromium.launch(
+        headless=True,
+        args=launch_args,
+    )
+
+
+# Fallbacks inside the block share one lazily launched Chromium per thread; each fetch still gets a fresh context.
+@contextmanager
+def playwright_session() -> Iterator[None]:
+    if getattr(_PLAYWRIGHT_SESSION, "active", False):
+        yield
+        return
+    _PLAYWRIGHT_SESSION.active = True
+    try:
+        yield
+    finally:
+        _PLAYWRIGHT_SESSION.active = False
+        _close_session_browser()
+
+
+def _session_browser() -> Any:
+    browser = getattr(_PLAYWRIGHT_SESSION, "browser", None)
+    if browser is not None and browser.is_connected():
+        return browser
+    _close_session_browser()
+    from playwright.sync_api import sync_playwright
+
+    playwright = sync_playwright().start()
+    _PLAYWRIGHT_SESSION.playwright = playwright
+    _PLAYWRIGHT_SESSION.browser = _launch_chromium(playwright)
+    return _PLAYWRIGHT_SESSION.browser
+
+
+def _close_session_browser() -> None:
+    browser = getattr(_PLAYWRIGHT_SESSION, "browser", None)
+    playwright = getattr(_PLAYWRIGHT_SESSION, "playwright", None)
+    _PLAYWRIGHT_SESSION.browser = None
+    _PLAYWRIGHT_SESSION.playwright = None
+    safe_close(None, None, browser)
+    if playwright is not None:
+        try:
+            playwright.stop()
+        except Exception:
+            LOGGER.debug("Playwright driver already stopped or could not stop.", exc_info=True)
+
+
 def fetch_with_playwright(url: str, headers: dict[str, str]) -> PlaywrightResult:
     if not _ensure_playwright_browsers_installed():
         LOGGER.error("Playwright browser install missing or failed; skipping browser fallback.")
@@ -1843,20 +1977,17 @@ def fetch_with_playwright(url: str, headers: dict[str, str]) -> PlaywrightResult
     browser = None
     context = None
     debug_artifacts: list[str] = []
+    # Inside playwright_session() the warm browser is borrowed; `browser` stays None so it is not closed.
+    in_session = getattr(_PLAYWRIGHT_SESSION, "active", False)
     try:
-        with sync_playwright() as playwright:
+        with nullcontext() if in_session else sync_playwright() as playwright:
             user_agent = headers.get("User-Agent")
-            launch_args = [
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-            ]
-            if os.getenv("EBAY_NO_SANDBOX") == "1":
-                launch_args.extend(["--no-sandbox", "--disable-setuid-sandbox"])
-            browser = playwright.chromium.launch(
-                headless=True,
-                args=launch_args,
-            )
-            context = browser.new_context(
+            if in_session:
+                context_browser = _session_browser()
+            else:
+                browser = _launch_chromium(playwright)
+                context_browser = browser
+            context = context_browser.new_context(
                 viewport={"width": 1280, "height": 800},
                 locale="en-GB",
                 timezone_id="Europe/London",
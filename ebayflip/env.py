@@ -13,7 +13,7 @@ def load_dotenv(path: str | Path = ".env") -> bool:
     - Existing environment variables are not overwritten.
     """
     p = Path(path)
-    if not p.exists() or not p.is_file():
+    if not p.is_file():
         return False
     try:
         raw = p.read_text(encoding="utf-8")
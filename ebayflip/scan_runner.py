@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-from ebayflip.dashboard_data import scan_age_seconds
+from ebayflip.dashboard_data import file_signature, scan_age_seconds
 
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
@@ -23,6 +23,7 @@ LOG_PATH = CACHE_DIR / "scan_last.log"
 
 _THREAD_LOCK = threading.Lock()
 _SCAN_THREAD: Optional[threading.Thread] = None
+_STATUS_MEMO: Optional[tuple[tuple[int, int], "ScanStatus"]] = None
 
 
 def _now_iso() -> str:
@@ -47,14 +48,31 @@ class ScanStatus:
 
 
 def _write_status(status: ScanStatus) -> None:
+    global _STATUS_MEMO
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     try:
         STATUS_PATH.write_text(json.dumps(asdict(status), indent=2), encoding="utf-8")
     except OSError:
-        pass
+        return
+    signature = file_signature(STATUS_PATH)
+    _STATUS_MEMO = (signature, status) if signature is not None else None
 
 
 def _read_status() -> ScanStatus:
+    """Status from disk, re-parsed only when the file's (mtime_ns, size) changes."""
+    global _STATUS_MEMO
+    signature = file_signature(STATUS_PATH)
+    if signature is None:
+        return ScanStatus(status="idle")
+    memo = _STATUS_MEMO
+    if memo is not None and memo[0] == signature:
+        return memo[1]
+    status = _parse_status_file()
+    _STATUS_MEMO = (signature, status)
+    return status
+
+
+def _parse_status_file() -> ScanStatus:
     try:
         raw = STATUS_PATH.read_text(encoding="utf-8")
         data = json.loads(raw)
@@ -89,21 +107,26 @@ def scan_run_status() -> dict[str, Any]:
     }
 
 
-def _lock_is_stale(*, ttl_seconds: int) -> bool:
+def _lock_age_seconds() -> float | None:
+    """Age of the lock file from a single stat; None when no lock exists."""
     try:
-        age = time.time() - LOCK_PATH.stat().st_mtime
-        return age > ttl_seconds
+        return time.time() - LOCK_PATH.stat().st_mtime
+    except FileNotFoundError:
+        return None
     except OSError:
-        return True
+        # An unreadable lock is treated as stale, same as an expired one.
+        return float("inf")
 
 
 def _acquire_lock(*, ttl_seconds: int) -> bool:
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    if LOCK_PATH.exists() and not _lock_is_stale(ttl_seconds=ttl_seconds):
-        return False
-    if LOCK_PATH.exists():
+    lock_age = _lock_age_seconds()
+    if lock_age is not None:
+        if lock_age <= ttl_seconds:
+            return False
+        # A racing dashboard may already have cleared the stale lock; O_EXCL below decides who wins.
         try:
-            LOCK_PATH.unlink()
+            LOCK_PATH.unlink(missing_ok=True)
         except OSError:
             return False
     try:
@@ -117,7 +140,7 @@ def _acquire_lock(*, ttl_seconds: int) -> bool:
 
 def _release_lock() -> None:
     try:
-        LOCK_PATH.unlink()
+        LOCK_PATH.unlink(missing_ok=True)
     except OSError:
         pass
 
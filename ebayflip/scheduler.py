@@ -5,6 +5,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import os
+import threading
 from typing import Optional
 
 from ebayflip import get_logger
@@ -21,7 +22,13 @@ from ebayflip.db import (
     release_alert_send,
     upsert_listing,
 )
-from ebayflip.ebay_client import EbayClient, RequestBudget, SearchAttemptLog, SearchResult
+from ebayflip.ebay_client import (
+    EbayClient,
+    RequestBudget,
+    SearchAttemptLog,
+    SearchResult,
+    playwright_session,
+)
 from ebayflip.models import CompStats, Evaluation, Listing, Target
 from ebayflip.scoring import evaluate_listing
 
@@ -133,16 +140,17 @@ class ArbitrageScanner:
         workers = max(1, int(self.config.run.scan_workers or 1))
         can_parallelize = isinstance(self.client, EbayClient)
         if workers == 1 or len(targets) <= 1 or not can_parallelize:
-            for target in targets:
-                if self.stop_scan:
-                    break
-                result = self._scan_target(target, self.client)
-                self._merge_result(result)
-                self.total_request_count = self._client_total_requests(self.client)
-                if result.request_cap_reached:
-                    self.stop_scan = True
-                    self.request_cap_reached = True
-                    break
+            with playwright_session():
+                for target in targets:
+                    if self.stop_scan:
+                        break
+                    result = self._scan_target(target, self.client)
+                    self._merge_result(result)
+                    self.total_request_count = self._client_total_requests(self.client)
+                    if result.request_cap_reached:
+                        self.stop_scan = True
+                        self.request_cap_reached = True
+                        break
         else:
             self._scan_parallel(targets, workers=workers)
             if self.total_request_count >= self.config.run.request_cap:
@@ -163,17 +171,26 @@ class ArbitrageScanner:
 
     def _scan_parallel(self, targets: list[Target], *, workers: int) -> None:
         LOGGER.info("Running parallel scan with %s worker(s) across %s target(s).", workers, len(targets))
-        worker_clients: list[EbayClient] = []
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {}
-            for target in targets:
+        # One client per worker thread, reused across its targets, so HTTP sessions and caches stay warm.
+        thread_state = threading.local()
+
+        def scan_with_worker_client(target: Target) -> TargetScanResult:
+            worker_client = getattr(thread_state, "client", None)
+            if worker_client is None:
                 worker_client = EbayClient(
                     self.config.run,
                     app_id=self.client.app_id,
                     request_budget=self.request_budget,
                 )
-                worker_clients.append(worker_client)
-                future = executor.submit(self._scan_target, target, worker_client)
+                thread_state.client = worker_client
+            # Pool threads have no teardown hook, so the warm browser is scoped to one target's searches.
+            with playwright_session():
+                return self._scan_target(target, worker_client)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for target in targets:
+                future = executor.submit(scan_with_worker_client, target)
                 futures[future] = target
             for future in as_completed(futures):
                 target = futures[future]
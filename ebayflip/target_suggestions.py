@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import re
 import statistics
 from dataclasses import dataclass
@@ -205,5 +206,5 @@ def suggest_targets_from_evaluations(
             item.source_count,
         )
 
-    ranked = sorted(suggestions, key=_rank_key, reverse=True)
-    return ranked[: max(0, limit)]
+    # Only the top `limit` are kept, so a bounded heap beats sorting every suggestion.
+    return heapq.nlargest(max(0, limit), suggestions, key=_rank_key)
@@ -18,6 +18,7 @@ from ebayflip.env import load_dotenv
 load_dotenv(ROOT_DIR / ".env")
 
 from ebayflip.config import AlertSettings, AppConfig, RunSettings
+from ebayflip.dashboard_data import file_signature, read_tail_lines
 from ebayflip.db import (
     add_target,
     init_db,
@@ -35,6 +36,9 @@ DB_PATH = ROOT_DIR / "ebayflip.sqlite"
 DATA_DIR = ROOT_DIR / "data"
 LATEST_PATH = DATA_DIR / "latest.json"
 HISTORY_PATH = DATA_DIR / "history.jsonl"
+# history.jsonl may grow to this multiple of --history-max-lines before it is compacted.
+HISTORY_SLACK_FACTOR = 2
+_HISTORY_LINE_COUNT_MEMO: tuple[tuple[int, int], int] | None = None
 DEFAULT_SEED_TARGETS: tuple[str, ...] = (
     "Nintendo Switch OLED",
     "AirPods Pro 2",
@@ -48,7 +52,10 @@ def _parse_args() -> argparse.Namespace:
         "--history-max-lines",
         type=int,
         default=200,
-        help="Maximum number of snapshots to keep in data/history.jsonl.",
+        help=(
+            "Number of snapshots kept in data/history.jsonl. The file may grow to "
+            f"{HISTORY_SLACK_FACTOR}x this many lines before it is trimmed back to the newest ones."
+        ),
     )
     parser.add_argument(
         "--watch",
@@ -137,53 +144,49 @@ def _ensure_scan_targets(db_path: str, *, settings: RunSettings, discovery_rows:
 
 
 def _source_from_row(row: dict[str, Any], *, fallback: str) -> str:
-    raw = row.get("raw_json")
-    if not isinstance(raw, str) or not raw.strip():
-        return fallback
-    try:
-        decoded = json.loads(raw)
-    except json.JSONDecodeError:
-        return fallback
-    if isinstance(decoded, dict):
-        source = decoded.get("source")
-        if isinstance(source, str) and source.strip():
-            return source.strip()
+    source = row.get("source")
+    if isinstance(source, str) and source.strip():
+        return source.strip()
     return fallback
 
 
+def _serialize_row(row: dict[str, Any], *, settings: RunSettings) -> dict[str, Any]:
+    reasons = row.get("reasons_json")
+    parsed_reasons: list[str] = []
+    if isinstance(reasons, str) and reasons:
+        try:
+            decoded = json.loads(reasons)
+            if isinstance(decoded, list):
+                parsed_reasons = [str(reason) for reason in decoded]
+        except json.JSONDecodeError:
+            parsed_reasons = []
+
+    return {
+        "listing_id": row.get("listing_id"),
+        "title": row.get("title"),
+        "url": row.get("url"),
+        "total_buy_gbp": row.get("total_buy_gbp"),
+        "resale_est_gbp": row.get("resale_est_gbp"),
+        "expected_profit_gbp": row.get("expected_profit_gbp"),
+        "roi": row.get("roi"),
+        "confidence": row.get("confidence"),
+        "deal_score": row.get("deal_score"),
+        "decision": row.get("decision"),
+        "reasons": parsed_reasons,
+        "evaluated_at": row.get("evaluated_at"),
+        "image_url": row.get("image_url"),
+        "location": row.get("location"),
+        "listing_type": row.get("listing_type"),
+        "source": _source_from_row(row, fallback=settings.marketplace),
+        "buy_marketplace": settings.marketplace,
+        "sell_marketplace": settings.sell_marketplace,
+    }
+
+
 def _serialize_items(rows: list[dict[str, Any]], *, settings: RunSettings) -> list[dict[str, Any]]:
-    items_by_key: dict[tuple[Any, ...], dict[str, Any]] = {}
+    # Each timestamp is parsed once, and only the surviving row per listing is serialized.
+    latest_by_key: dict[tuple[Any, ...], tuple[datetime | None, dict[str, Any]]] = {}
     for row in rows:
-        reasons = row.get("reasons_json")
-        parsed_reasons: list[str] = []
-        if isinstance(reasons, str) and reasons:
-            try:
-                decoded = json.loads(reasons)
-                if isinstance(decoded, list):
-                    parsed_reasons = [str(reason) for reason in decoded]
-            except json.JSONDecodeError:
-                parsed_reasons = []
-
-        item = {
-            "listing_id": row.get("listing_id"),
-            "title": row.get("title"),
-            "url": row.get("url"),
-            "total_buy_gbp": row.get("total_buy_gbp"),
-            "resale_est_gbp": row.get("resale_est_gbp"),
-            "expected_profit_gbp": row.get("expected_profit_gbp"),
-            "roi": row.get("roi"),
-            "confidence": row.get("confidence"),
-            "deal_score": row.get("deal_score"),
-            "decision": row.get("decision"),
-            "reasons": parsed_reasons,
-            "evaluated_at": row.get("evaluated_at"),
-            "image_url": row.get("image_url"),
-            "location": row.get("location"),
-            "listing_type": row.get("listing_type"),
-            "source": _source_from_row(row, fallback=settings.marketplace),
-            "buy_marketplace": settings.marketplace,
-            "sell_marketplace": settings.sell_marketplace,
-        }
         key = (
             row.get("listing_id"),
             row.get("url"),
@@ -191,19 +194,16 @@ def _serialize_items(rows: list[dict[str, Any]], *, settings: RunSettings) -> li
             row.get("location"),
             row.get("listing_type"),
         )
-        existing = items_by_key.get(key)
-        if existing is None:
-            items_by_key[key] = item
-            continue
-        existing_dt = _parse_iso(existing.get("evaluated_at"))
-        candidate_dt = _parse_iso(item.get("evaluated_at"))
-        if existing_dt is None or (candidate_dt is not None and candidate_dt > existing_dt):
-            items_by_key[key] = item
-    return sorted(
-        items_by_key.values(),
-        key=lambda item: _parse_iso(item.get("evaluated_at")) or datetime.min.replace(tzinfo=timezone.utc),
-        reverse=True,
-    )
+        evaluated_at = _parse_iso(row.get("evaluated_at"))
+        existing = latest_by_key.get(key)
+        if existing is not None:
+            existing_dt = existing[0]
+            if existing_dt is not None and (evaluated_at is None or evaluated_at <= existing_dt):
+                continue
+        latest_by_key[key] = (evaluated_at, row)
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
+    ranked = sorted(latest_by_key.values(), key=lambda entry: entry[0] or oldest, reverse=True)
+    return [_serialize_row(row, settings=settings) for _, row in ranked]
 
 
 def _parse_iso(value: Any) -> datetime | None:
@@ -218,7 +218,12 @@ def _parse_iso(value: Any) -> datetime | None:
     return dt
 
 
-def _filter_rows_since(rows: list[dict[str, Any]], *, since: datetime) -> list[dict[str, Any]]:
+def _filter_rows_since(
+    rows: list[dict[str, Any]],
+    *,
+    since: datetime,
+    newest_first: bool = False,
+) -> list[dict[str, Any]]:
     filtered: list[dict[str, Any]] = []
     for row in rows:
         evaluated_at = _parse_iso(row.get("evaluated_at"))
@@ -226,22 +231,62 @@ def _filter_rows_since(rows: list[dict[str, Any]], *, since: datetime) -> list[d
             continue
         if evaluated_at >= since:
             filtered.append(row)
+        elif newest_first:
+            # Every remaining row is older, so the rest of the history never needs parsing.
+            break
     return filtered
 
 
+def _history_line_count() -> int:
+    # Watch mode appends from one process, so only the first write (or an outside rewrite) counts newlines.
+    global _HISTORY_LINE_COUNT_MEMO
+    signature = file_signature(HISTORY_PATH)
+    if signature is None:
+        return 0
+    memo = _HISTORY_LINE_COUNT_MEMO
+    if memo is not None and memo[0] == signature:
+        return memo[1]
+    count = 0
+    last = b"\n"
+    with HISTORY_PATH.open("rb") as handle:
+        while block := handle.read(1024 * 1024):
+            count += block.count(b"\n")
+            last = block[-1:]
+    if last != b"\n":
+        count += 1
+    _HISTORY_LINE_COUNT_MEMO = (signature, count)
+    return count
+
+
 def _write_snapshot(snapshot: dict[str, Any], history_max_lines: int) -> None:
+    global _HISTORY_LINE_COUNT_MEMO
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     LATEST_PATH.write_text(json.dumps(snapshot, indent=2), encoding="utf-8")
 
     if history_max_lines <= 0:
         return
 
-    existing_lines: list[str] = []
-    if HISTORY_PATH.exists():
-        existing_lines = [line for line in HISTORY_PATH.read_text(encoding="utf-8").splitlines() if line.strip()]
-    existing_lines.append(json.dumps(snapshot))
-    pruned_lines = existing_lines[-history_max_lines:]
-    HISTORY_PATH.write_text("\n".join(pruned_lines) + "\n", encoding="utf-8")
+    line = json.dumps(snapshot)
+    # Appending is the common case; the file is only rewritten once it outgrows the slack, and
+    # readers already limit themselves to the newest entries.
+    line_count = _history_line_count()
+    if line_count < history_max_lines * HISTORY_SLACK_FACTOR:
+        with HISTORY_PATH.open("a+b") as handle:
+            size = handle.seek(0, os.SEEK_END)
+            if size:
+                handle.seek(size - 1)
+                if handle.read(1) != b"\n":
+                    handle.write(b"\n")
+            handle.write(line.encode("utf-8") + b"\n")
+        line_count += 1
+    else:
+        kept_lines = [existing for existing in read_tail_lines(HISTORY_PATH, history_max_lines) if existing.strip()]
+        kept_lines = kept_lines[max(0, len(kept_lines) - history_max_lines + 1) :]
+        kept_lines.append(line)
+        HISTORY_PATH.write_text("\n".join(kept_lines) + "\n", encoding="utf-8")
+        line_count = len(kept_lines)
+    signature = file_signature(HISTORY_PATH)
+    _HISTORY_LINE_COUNT_MEMO = (signature, line_count) if signature is not None else None
 
 
 def _zero_result_summary(summary: Any) -> list[dict[str, Any]]:
@@ -273,8 +318,10 @@ def _run_once(config: AppConfig, *, history_max_lines: int) -> dict[str, Any]:
     client = EbayClient(config.run, app_id=os.getenv("EBAY_APP_ID"))
     summary = run_scan(config, client)
 
-    rows = list_evaluations_with_listings(config.db_path)
-    rows = _filter_rows_since(rows, since=run_started_at)
+    # Only this run's evaluations leave sqlite; the Python pass keeps the exact datetime comparison.
+    rows = list_evaluations_with_listings(config.db_path, since=run_started_at.isoformat())
+    # list_evaluations_with_listings orders by evaluated_at DESC.
+    rows = _filter_rows_since(rows, since=run_started_at, newest_first=True)
     items = _serialize_items(rows, settings=config.run)
     generated_at = datetime.now(timezone.utc).isoformat()
     zero_result_info = _zero_result_summary(summary)
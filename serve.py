@@ -24,7 +24,8 @@ from pathlib import Path
 from typing import Any
 
 try:
-    from flask import Flask, Response, jsonify, render_template_string, request
+    from flask import Flask, Response, jsonify, render_template, request
+    from jinja2 import DictLoader
 except ImportError:
     raise SystemExit(
         "Flask is required for the standalone server.\n"
@@ -39,14 +40,17 @@ HISTORY_PATH = ROOT_DIR / "data" / "history.jsonl"
 app = Flask(__name__)
 _SCAN_LOCK = threading.Lock()
 _LAST_SCAN_TRIGGER_MONO = 0.0
+_LATEST_SCAN_MEMO: tuple[tuple[str, int, int], dict[str, Any] | None] | None = None
+_ENRICHED_ITEMS_MEMO: tuple[dict[str, Any], float, list[dict[str, Any]]] | None = None
 
 from ebayflip.env import load_dotenv
 
 load_dotenv(ROOT_DIR / ".env")
 
 from ebayflip.dashboard_data import (
+    file_signature,
     filter_items,
-    items_to_csv_bytes,
+    iter_items_csv,
     load_history,
     load_latest_scan,
     scan_age_seconds,
@@ -241,6 +245,39 @@ setTimeout(() => location.reload(), 60000);
 </html>
 """
 
+# Served through the app's template loader so Jinja compiles it once and reuses it per request.
+app.jinja_loader = DictLoader({"dashboard.html": DASHBOARD_HTML})
+
+
+def _load_latest_scan() -> dict[str, Any] | None:
+    # Every route reads latest.json; only re-parse after the scanner has replaced it.
+    global _LATEST_SCAN_MEMO
+    stat_signature = file_signature(LATEST_SCAN_PATH)
+    if stat_signature is None:
+        return None
+    signature = (str(LATEST_SCAN_PATH), *stat_signature)
+    memo = _LATEST_SCAN_MEMO
+    if memo is not None and memo[0] == signature:
+        return memo[1]
+    data = load_latest_scan(LATEST_SCAN_PATH)
+    _LATEST_SCAN_MEMO = (signature, data)
+    return data
+
+
+def _enriched_items(data: dict[str, Any], target_profit: float) -> list[dict[str, Any]]:
+    # Keyed on the memoised payload object itself, so a re-parsed latest.json always re-enriches.
+    global _ENRICHED_ITEMS_MEMO
+    memo = _ENRICHED_ITEMS_MEMO
+    if memo is not None and memo[0] is data and memo[1] == target_profit:
+        return memo[2]
+    items = enrich_items(
+        sort_items(data.get("items") or []),
+        RunSettings.from_env(),
+        target_profit_gbp=target_profit,
+    )
+    _ENRICHED_ITEMS_MEMO = (data, target_profit, items)
+    return items
+
 
 def _to_render_items(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
     rendered: list[dict[str, Any]] = []
@@ -297,7 +334,7 @@ def _acquire_scan_slot() -> bool:
 
 @app.route("/")
 def dashboard():
-    data = load_latest_scan(LATEST_SCAN_PATH)
+    data = _load_latest_scan()
     items: list[dict[str, Any]] = []
     last_scan = "-"
     zero_targets = []
@@ -305,11 +342,7 @@ def dashboard():
     summary_stats = {"deal_count": 0, "maybe_count": 0, "total_profit": 0.0, "total_items": 0}
 
     if data:
-        items = enrich_items(
-            sort_items(data.get("items") or []),
-            RunSettings.from_env(),
-            target_profit_gbp=float(os.getenv("FLIP_TARGET_PROFIT", "20")),
-        )
+        items = _enriched_items(data, float(os.getenv("FLIP_TARGET_PROFIT", "20")))
         scan_summary = data.get("scan_summary") or {}
         marketplaces = data.get("marketplaces") or {}
         buy_market = marketplaces.get("buy") or scan_summary.get("buy_marketplace") or "buy"
@@ -319,8 +352,8 @@ def dashboard():
         zero_targets = scan_summary.get("zero_result_targets") or []
         summary_stats = summarize_items(items)
 
-    return render_template_string(
-        DASHBOARD_HTML,
+    return render_template(
+        "dashboard.html",
         data=data,
         items=_to_render_items(items),
         deal_count=summary_stats["deal_count"],
@@ -335,7 +368,7 @@ def dashboard():
 
 @app.route("/api/latest")
 def api_latest():
-    data = load_latest_scan(LATEST_SCAN_PATH)
+    data = _load_latest_scan()
     if data is None:
         return jsonify({"error": "No scan data found"}), 404
     decision_raw = request.args.get("decision", "All")
@@ -352,12 +385,7 @@ def api_latest():
     target_profit = _query_float("target_profit")
     if target_profit is None:
         target_profit = float(os.getenv("FLIP_TARGET_PROFIT", "20"))
-    run_settings = RunSettings.from_env()
-    source_items = enrich_items(
-        sort_items(data.get("items") or []),
-        run_settings,
-        target_profit_gbp=target_profit,
-    )
+    source_items = _enriched_items(data, target_profit)
     items = filter_items(
         source_items,
         decision=decision_normalized,
@@ -380,7 +408,7 @@ def api_latest():
 
 @app.route("/api/health")
 def api_health():
-    data = load_latest_scan(LATEST_SCAN_PATH)
+    data = _load_latest_scan()
     healthy = data is not None
     age_seconds = scan_age_seconds(data)
     return jsonify({
@@ -393,13 +421,12 @@ def api_health():
 
 @app.route("/api/export/csv")
 def api_export_csv():
-    data = load_latest_scan(LATEST_SCAN_PATH)
+    data = _load_latest_scan()
     if data is None:
         return Response("No scan data available", status=404, mimetype="text/plain")
 
-    csv_bytes = items_to_csv_bytes(sort_items(data.get("items") or []))
     return Response(
-        csv_bytes,
+        iter_items_csv(sort_items(data.get("items") or [])),
         mimetype="text/csv",
         headers={"Content-Disposition": "attachment; filename=keyflip_scan.csv"},
     )
@@ -407,9 +434,9 @@ def api_export_csv():
 
 @app.route("/api/history")
 def api_history():
-    entries = load_history(HISTORY_PATH)
+    entries = load_history(HISTORY_PATH, limit=50)
     summary = []
-    for entry in entries[-50:]:
+    for entry in entries:
         summary.append({
             "generated_at": entry.get("generated_at"),
             "count": entry.get("count", 0),
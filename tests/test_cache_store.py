@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+from ebayflip.cache import CacheStore
+
+
+def test_cache_store_enables_wal_journal(tmp_path) -> None:
+    path = str(tmp_path / "cache.sqlite")
+    CacheStore(path, ttl_seconds=60)
+    with sqlite3.connect(path) as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode.lower() == "wal"
+
+
+def test_cache_store_reuses_connection_per_thread(tmp_path) -> None:
+    store = CacheStore(str(tmp_path / "cache.sqlite"), ttl_seconds=60)
+    conn = store._connect()
+    assert store._connect() is conn
+
+    other: list[sqlite3.Connection] = []
+    worker = threading.Thread(target=lambda: other.append(store._connect()))
+    worker.start()
+    worker.join()
+    assert other and other[0] is not conn
+
+    store.close()
+    assert store._connect() is not conn
@@ -5,6 +5,9 @@ from datetime import datetime, timezone
 from ebayflip.dashboard_data import (
     filter_items,
     items_to_csv_bytes,
+    iter_items_csv,
+    load_history,
+    load_latest_scan,
     scan_age_seconds,
     sort_items,
     summarize_items,
@@ -44,8 +47,57 @@ def test_items_to_csv_contains_rows() -> None:
     assert "deal,C Phone" in text
 
 
+def test_iter_items_csv_yields_header_then_one_chunk_per_item() -> None:
+    chunks = list(iter_items_csv(_items()))
+    assert len(chunks) == 4
+    assert chunks[0].startswith("decision,title,url")
+    assert "".join(chunks).encode("utf-8") == items_to_csv_bytes(_items())
+
+
 def test_scan_age_seconds_handles_iso() -> None:
     payload = {"generated_at": datetime.now(timezone.utc).isoformat()}
     age = scan_age_seconds(payload)
     assert age is not None
     assert age >= 0
+
+
+def test_load_history_skips_invalid_lines(tmp_path) -> None:
+    path = tmp_path / "history.jsonl"
+    path.write_text('{"count": 1}\nnot json\n\n{"count": 2, "ratio": NaN}\n', encoding="utf-8")
+    entries = load_history(path)
+    assert [entry["count"] for entry in entries] == [1, 2]
+
+
+def test_load_latest_scan_returns_none_for_invalid_json(tmp_path) -> None:
+    path = tmp_path / "latest.json"
+    path.write_text("{broken", encoding="utf-8")
+    assert load_latest_scan(path) is None
+
+
+def test_load_history_limit_reads_only_tail(tmp_path, monkeypatch) -> None:
+    import ebayflip.dashboard_data as dashboard_data
+
+    monkeypatch.setattr(dashboard_data, "_TAIL_BLOCK_SIZE", 16)
+    path = tmp_path / "history.jsonl"
+    path.write_text("".join(f'{{"count": {i}, "title": "£{i}"}}\n' for i in range(40)), encoding="utf-8")
+
+    tail = load_history(path, limit=5)
+    assert [entry["count"] for entry in tail] == [35, 36, 37, 38, 39]
+    assert load_history(path, limit=100) == load_history(path)
+    assert load_history(path, limit=0) == []
+
+
+def test_loaders_handle_missing_files(tmp_path) -> None:
+    assert load_latest_scan(tmp_path / "latest.json") is None
+    assert load_history(tmp_path / "history.jsonl") == []
+    assert load_history(tmp_path / "history.jsonl", limit=5) == []
+
+
+def test_filter_items_applies_confidence_and_actionable_filters() -> None:
+    items = [
+        {"decision": "deal", "title": "A", "confidence": 0.9, "is_actionable": True},
+        {"decision": "deal", "title": "B", "confidence": 0.3, "is_actionable": True},
+        {"decision": "maybe", "title": "C", "confidence": 0.8, "is_actionable": False},
+    ]
+    assert [item["title"] for item in filter_items(items, min_confidence=0.5)] == ["A", "C"]
+    assert [item["title"] for item in filter_items(items, min_confidence=0.5, actionable_only=True)] == ["A"]
@@ -43,3 +43,19 @@ def test_prune_stale_listings_removes_old_rows(tmp_path) -> None:
         count = conn.execute("SELECT COUNT(*) AS c FROM listings").fetchone()["c"]
     assert count == 1
 
+
+def test_connections_use_wal_with_normal_sync(tmp_path) -> None:
+    db_path = str(tmp_path / "db.sqlite")
+    init_db(db_path)
+    with get_connection(db_path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_recreated_database_is_switched_to_wal(tmp_path) -> None:
+    db_path = tmp_path / "db.sqlite"
+    init_db(str(db_path))
+    db_path.unlink()
+    init_db(str(db_path))
+    with get_connection(str(db_path)) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal"
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import subprocess
+
+import pytest
+
+from ebayflip import ebay_client
+
+
+def test_browser_check_runs_once_after_success(monkeypatch) -> None:
+    calls: list[int] = []
+
+    def fake_detect() -> bool:
+        calls.append(1)
+        return True
+
+    monkeypatch.setattr(ebay_client, "_PLAYWRIGHT_BROWSERS_READY", False)
+    monkeypatch.setattr(ebay_client, "_detect_or_install_playwright_browsers", fake_detect)
+    assert ebay_client._ensure_playwright_browsers_installed() is True
+    assert ebay_client._ensure_playwright_browsers_installed() is True
+    assert len(calls) == 1
+
+
+def test_browser_check_retries_after_failure(monkeypatch) -> None:
+    calls: list[int] = []
+
+    def fake_detect() -> bool:
+        calls.append(1)
+        return False
+
+    monkeypatch.setattr(ebay_client, "_PLAYWRIGHT_BROWSERS_READY", False)
+    monkeypatch.setattr(ebay_client, "_detect_or_install_playwright_browsers", fake_detect)
+    assert ebay_client._ensure_playwright_browsers_installed() is False
+    assert ebay_client._ensure_playwright_browsers_installed() is False
+    assert len(calls) == 2
+
+
+def test_browsers_dir_populated_checks_for_entries(tmp_path) -> None:
+    assert ebay_client._browsers_dir_populated(str(tmp_path / "missing")) is False
+    assert ebay_client._browsers_dir_populated(str(tmp_path)) is False
+    (tmp_path / "chromium-1200").mkdir()
+    assert ebay_client._browsers_dir_populated(str(tmp_path)) is True
+
+
+def test_ready_marker_requires_recorded_executable(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(ebay_client, "_PLAYWRIGHT_BROWSERS_PATH", str(tmp_path))
+    assert ebay_client._ready_marker_valid() is False
+
+    executable = tmp_path / "chromium-1200" / "chrome"
+    executable.parent.mkdir()
+    executable.write_text("", encoding="utf-8")
+    ebay_client._write_ready_marker(executable)
+    assert ebay_client._ready_marker_valid() is True
+
+    executable.unlink()
+    assert ebay_client._ready_marker_valid() is False
+
+
+def test_ready_marker_invalid_after_playwright_upgrade(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(ebay_client, "_PLAYWRIGHT_BROWSERS_PATH", str(tmp_path))
+    executable = tmp_path / "chromium-1200" / "chrome"
+    executable.parent.mkdir()
+    executable.write_text("", encoding="utf-8")
+    monkeypatch.setattr(ebay_client, "_playwright_version", lambda: "1.57.0")
+    ebay_client._write_ready_marker(executable)
+    assert ebay_client._ready_marker_valid() is True
+
+    monkeypatch.setattr(ebay_client, "_playwright_version", lambda: "1.58.0")
+    assert ebay_client._ready_marker_valid() is False
+
+
+def test_install_writes_ready_marker(monkeypatch, tmp_path) -> None:
+    pytest.importorskip("playwright.sync_api")
+    monkeypatch.setattr(ebay_client, "_PLAYWRIGHT_BROWSERS_PATH", str(tmp_path))
+    executable = tmp_path / "chromium-1200" / "chrome"
+    probes: list[int] = []
+
+    def fake_probe(sync_playwright: object) -> object:
+        probes.append(1)
+        return executable if executable.exists() else None
+
+    def fake_install(*args: object, **kwargs: object) -> subprocess.CompletedProcess:
+        executable.parent.mkdir()
+        executable.write_text("", encoding="utf-8")
+        return subprocess.CompletedProcess(args, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(ebay_client, "_probe_chromium_executable", fake_probe)
+    monkeypatch.setattr(ebay_client.subprocess, "run", fake_install)
+    assert ebay_client._detect_or_install_playwright_browsers() is True
+    assert ebay_client._ready_marker_valid() is True
+    assert ebay_client._detect_or_install_playwright_browsers() is True
+    assert len(probes) == 1
+
+
+def test_ready_marker_skipped_for_bundled_browsers(monkeypatch) -> None:
+    monkeypatch.setattr(ebay_client, "_PLAYWRIGHT_BROWSERS_PATH", "0")
+    assert ebay_client._ready_marker_path() is None
+    assert ebay_client._ready_marker_valid() is False
+
+
+def test_playwright_session_reuses_one_browser_until_exit(monkeypatch) -> None:
+    sync_api = pytest.importorskip("playwright.sync_api")
+
+    class FakeBrowser:
+        def __init__(self) -> None:
+            self.closed = False
+
+        def is_connected(self) -> bool:
+            return not self.closed
+
+        def close(self) -> None:
+            self.closed = True
+
+    class FakeDriver:
+        stopped = False
+
+        def start(self) -> "FakeDriver":
+            return self
+
+        def stop(self) -> None:
+            self.stopped = True
+
+    driver = FakeDriver()
+    launched: list[FakeBrowser] = []
+
+    def fake_launch(playwright: object) -> FakeBrowser:
+        launched.append(FakeBrowser())
+        return launched[-1]
+
+    monkeypatch.setattr(sync_api, "sync_playwright", lambda: driver)
+    monkeypatch.setattr(ebay_client, "_launch_chromium", fake_launch)
+
+    with ebay_client.playwright_session():
+        with ebay_client.playwright_session():
+            browser = ebay_client._session_browser()
+        assert ebay_client._session_browser() is browser
+        assert not browser.closed
+    assert len(launched) == 1
+    assert browser.closed
+    assert driver.stopped
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+
+from scanner import run_scan
+
+
+def _use_tmp_data_dir(monkeypatch, tmp_path):
+    history = tmp_path / "history.jsonl"
+    monkeypatch.setattr(run_scan, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(run_scan, "LATEST_PATH", tmp_path / "latest.json")
+    monkeypatch.setattr(run_scan, "HISTORY_PATH", history)
+    monkeypatch.setattr(run_scan, "_HISTORY_LINE_COUNT_MEMO", None)
+    return history
+
+
+def _counts(history) -> list[int]:
+    return [json.loads(line)["count"] for line in history.read_text(encoding="utf-8").splitlines()]
+
+
+def test_write_snapshot_appends_past_cap_then_compacts(monkeypatch, tmp_path) -> None:
+    history = _use_tmp_data_dir(monkeypatch, tmp_path)
+    for count in range(6):
+        run_scan._write_snapshot({"count": count}, history_max_lines=3)
+    assert _counts(history) == [0, 1, 2, 3, 4, 5]
+    assert run_scan._HISTORY_LINE_COUNT_MEMO[1] == 6
+
+    run_scan._write_snapshot({"count": 6}, history_max_lines=3)
+    assert _counts(history) == [4, 5, 6]
+    assert json.loads((tmp_path / "latest.json").read_text(encoding="utf-8"))["count"] == 6
+
+
+def test_write_snapshot_repairs_missing_trailing_newline(monkeypatch, tmp_path) -> None:
+    history = _use_tmp_data_dir(monkeypatch, tmp_path)
+    history.write_text('{"count": 0}', encoding="utf-8")
+    run_scan._write_snapshot({"count": 1}, history_max_lines=5)
+    assert _counts(history) == [0, 1]
+
+
+def test_write_snapshot_trims_oversized_history(monkeypatch, tmp_path) -> None:
+    history = _use_tmp_data_dir(monkeypatch, tmp_path)
+    history.write_text("".join(json.dumps({"count": i}) + "\n" for i in range(100)), encoding="utf-8")
+    run_scan._write_snapshot({"count": 100}, history_max_lines=3)
+    assert _counts(history) == [98, 99, 100]
+
+
+def test_write_snapshot_recounts_after_outside_rewrite(monkeypatch, tmp_path) -> None:
+    history = _use_tmp_data_dir(monkeypatch, tmp_path)
+    run_scan._write_snapshot({"count": 0}, history_max_lines=3)
+    history.write_text("".join(json.dumps({"count": i}) + "\n" for i in range(1, 7)), encoding="utf-8")
+    run_scan._write_snapshot({"count": 7}, history_max_lines=3)
+    assert _counts(history) == [5, 6, 7]
@@ -4,6 +4,15 @@ import json
 from datetime import datetime, timezone
 
 from ebayflip.config import RunSettings
+from ebayflip.db import (
+    add_target,
+    get_connection,
+    init_db,
+    insert_evaluation,
+    list_evaluations_with_listings,
+    upsert_listing,
+)
+from ebayflip.models import Evaluation, Listing, Target
 from scanner.run_scan import _filter_rows_since, _serialize_items
 
 
@@ -25,7 +34,7 @@ def test_serialize_items_includes_source_and_marketplaces() -> None:
             "image_url": None,
             "location": "SF Bay Area",
             "listing_type": "fixed",
-            "raw_json": json.dumps({"source": "craigslist_html"}),
+            "source": "craigslist_html",
         }
     ]
     settings = RunSettings(marketplace="ebay", sell_marketplace="ebay")
@@ -48,6 +57,19 @@ def test_filter_rows_since_keeps_current_cycle_rows() -> None:
     assert [row["listing_id"] for row in filtered] == [2, 3]
 
 
+def test_filter_rows_since_stops_at_first_older_row_when_newest_first() -> None:
+    start = datetime(2026, 2, 10, 18, 0, 0, tzinfo=timezone.utc)
+    rows = [
+        {"evaluated_at": "2026-02-10T18:00:05+00:00", "listing_id": 3},
+        {"evaluated_at": None, "listing_id": 4},
+        {"evaluated_at": "2026-02-10T18:00:00+00:00", "listing_id": 2},
+        {"evaluated_at": "2026-02-10T17:59:59+00:00", "listing_id": 1},
+        {"evaluated_at": "2026-02-10T18:30:00+00:00", "listing_id": 5},
+    ]
+    filtered = _filter_rows_since(rows, since=start, newest_first=True)
+    assert [row["listing_id"] for row in filtered] == [3, 2]
+
+
 def test_serialize_items_deduplicates_to_latest_evaluation() -> None:
     rows = [
         {
@@ -59,7 +81,6 @@ def test_serialize_items_deduplicates_to_latest_evaluation() -> None:
             "evaluated_at": "2026-02-10T18:00:00+00:00",
             "location": "SF",
             "listing_type": "fixed",
-            "raw_json": "{}",
         },
         {
             "listing_id": 27,
@@ -70,7 +91,6 @@ def test_serialize_items_deduplicates_to_latest_evaluation() -> None:
             "evaluated_at": "2026-02-10T18:00:03+00:00",
             "location": "SF",
             "listing_type": "fixed",
-            "raw_json": "{}",
         },
     ]
     settings = RunSettings(marketplace="ebay", sell_marketplace="ebay")
@@ -81,3 +101,64 @@ def test_serialize_items_deduplicates_to_latest_evaluation() -> None:
     assert items[0]["decision"] == "deal"
     assert items[0]["deal_score"] == 35.0
     assert items[0]["evaluated_at"] == "2026-02-10T18:00:03+00:00"
+
+
+def _seed_evaluation(db_path: str, item_id: str, evaluated_at: str, *, raw_json=None) -> None:
+    target_id = add_target(db_path, Target(id=None, name=item_id, query=item_id))
+    listing_id, _ = upsert_listing(
+        db_path,
+        Listing(
+            ebay_item_id=item_id,
+            target_id=target_id,
+            title=f"Listing {item_id}",
+            url=f"https://example.test/{item_id}",
+            price_gbp=180.0,
+            shipping_gbp=0.0,
+            total_buy_gbp=180.0,
+            raw_json=raw_json,
+        ),
+    )
+    insert_evaluation(
+        db_path,
+        listing_id,
+        Evaluation(
+            resale_est_gbp=230.0,
+            ebay_fee_pct=0.13,
+            other_fees_gbp=0.0,
+            shipping_out_gbp=4.0,
+            buffer_gbp=5.0,
+            expected_profit_gbp=24.0,
+            roi=0.13,
+            confidence=0.6,
+            deal_score=55.0,
+            decision="deal",
+            reasons=[],
+            evaluated_at=evaluated_at,
+        ),
+    )
+
+
+def test_evaluation_rows_carry_source_without_raw_listing_json(tmp_path) -> None:
+    db_path = str(tmp_path / "source.sqlite")
+    init_db(db_path)
+    _seed_evaluation(db_path, "cl-1", "2026-01-01T00:00:00+00:00", raw_json={"source": "craigslist_html"})
+    _seed_evaluation(db_path, "bad-1", "2026-01-01T00:00:00+00:00")
+    with get_connection(db_path) as conn:
+        conn.execute("UPDATE listings SET raw_json = 'not json' WHERE ebay_item_id = 'bad-1'")
+
+    rows = list_evaluations_with_listings(db_path)
+    assert all("raw_json" not in row for row in rows)
+    settings = RunSettings(marketplace="ebay", sell_marketplace="ebay")
+    sources = {item["title"]: item["source"] for item in _serialize_items(rows, settings=settings)}
+    assert sources == {"Listing cl-1": "craigslist_html", "Listing bad-1": "ebay"}
+
+
+def test_evaluation_rows_since_filters_in_sql(tmp_path) -> None:
+    db_path = str(tmp_path / "since.sqlite")
+    init_db(db_path)
+    for evaluated_at in ("2026-01-01T00:00:00+00:00", "2026-01-02T00:00:00.250000+00:00"):
+        _seed_evaluation(db_path, "since-1", evaluated_at)
+
+    assert len(list_evaluations_with_listings(db_path)) == 2
+    rows = list_evaluations_with_listings(db_path, since="2026-01-02T00:00:00+00:00")
+    assert [row["evaluated_at"] for row in rows] == ["2026-01-02T00:00:00.250000+00:00"]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import os
+import time
+
+from ebayflip import scan_runner
+
+
+def _use_tmp_lock(monkeypatch, tmp_path):
+    lock_path = tmp_path / "scan.lock"
+    monkeypatch.setattr(scan_runner, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(scan_runner, "LOCK_PATH", lock_path)
+    return lock_path
+
+
+def test_acquire_lock_creates_lock_file(monkeypatch, tmp_path) -> None:
+    lock_path = _use_tmp_lock(monkeypatch, tmp_path)
+    assert scan_runner._acquire_lock(ttl_seconds=60) is True
+    assert lock_path.exists()
+
+
+def test_acquire_lock_respects_fresh_lock(monkeypatch, tmp_path) -> None:
+    lock_path = _use_tmp_lock(monkeypatch, tmp_path)
+    lock_path.write_text("pid=1\n", encoding="utf-8")
+    assert scan_runner._acquire_lock(ttl_seconds=60) is False
+
+
+def test_acquire_lock_replaces_stale_lock(monkeypatch, tmp_path) -> None:
+    lock_path = _use_tmp_lock(monkeypatch, tmp_path)
+    lock_path.write_text("pid=1\n", encoding="utf-8")
+    old = time.time() - 3600
+    os.utime(lock_path, (old, old))
+    assert scan_runner._acquire_lock(ttl_seconds=60) is True
+    assert f"pid={os.getpid()}" in lock_path.read_text(encoding="utf-8")
+
+
+def test_acquire_lock_tolerates_stale_lock_removed_by_another_process(monkeypatch, tmp_path) -> None:
+    lock_path = _use_tmp_lock(monkeypatch, tmp_path)
+    monkeypatch.setattr(scan_runner, "_lock_age_seconds", lambda: float("inf"))
+    assert scan_runner._acquire_lock(ttl_seconds=60) is True
+    assert lock_path.exists()
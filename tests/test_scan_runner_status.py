@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+
+from ebayflip import scan_runner
+
+
+def _use_tmp_status(monkeypatch, tmp_path):
+    status_path = tmp_path / "scan_status.json"
+    monkeypatch.setattr(scan_runner, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(scan_runner, "STATUS_PATH", status_path)
+    monkeypatch.setattr(scan_runner, "_STATUS_MEMO", None)
+    return status_path
+
+
+def test_read_status_defaults_to_idle_without_file(monkeypatch, tmp_path) -> None:
+    _use_tmp_status(monkeypatch, tmp_path)
+    assert scan_runner.scan_run_status()["status"] == "idle"
+
+
+def test_read_status_parses_file_once_until_it_changes(monkeypatch, tmp_path) -> None:
+    status_path = _use_tmp_status(monkeypatch, tmp_path)
+    status_path.write_text(json.dumps({"status": "running", "message": "Scan started"}), encoding="utf-8")
+    parses: list[int] = []
+    real_parse = scan_runner._parse_status_file
+
+    def counting_parse():
+        parses.append(1)
+        return real_parse()
+
+    monkeypatch.setattr(scan_runner, "_parse_status_file", counting_parse)
+    assert scan_runner.scan_run_status()["status"] == "running"
+    assert scan_runner.scan_run_status()["status"] == "running"
+    assert len(parses) == 1
+
+    status_path.write_text(json.dumps({"status": "ok", "returncode": 0}), encoding="utf-8")
+    assert scan_runner.scan_run_status()["status"] == "ok"
+    assert len(parses) == 2
+
+
+def test_write_status_is_visible_without_reparsing(monkeypatch, tmp_path) -> None:
+    _use_tmp_status(monkeypatch, tmp_path)
+    monkeypatch.setattr(scan_runner, "_parse_status_file", lambda: scan_runner.ScanStatus(status="idle"))
+    scan_runner._write_status(scan_runner.ScanStatus(status="error", returncode=124))
+    status = scan_runner.scan_run_status()
+    assert status["status"] == "error"
+    assert status["returncode"] == 124
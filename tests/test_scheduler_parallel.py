@@ -26,3 +26,32 @@ def test_scanner_uses_parallel_path_when_enabled(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr(scanner, "_scan_parallel", fake_scan_parallel)
     scanner.scan()
     assert called["parallel"] is True
+
+
+def test_parallel_scan_reuses_one_client_per_worker(monkeypatch, tmp_path) -> None:
+    from ebayflip import scheduler
+
+    db_path = str(tmp_path / "parallel_clients.sqlite")
+    init_db(db_path)
+    settings = RunSettings(scan_workers=2)
+    config = AppConfig(db_path=db_path, run=settings, alerts=AlertSettings(discord_webhook_url=None))
+    scanner = ArbitrageScanner(config=config, client=EbayClient(settings))
+    created: list[object] = []
+    used: list[object] = []
+
+    class FakeClient:
+        def __init__(self, *args, **kwargs) -> None:
+            created.append(self)
+
+    def fake_scan_target(target, client):
+        used.append(client)
+        return scheduler.TargetScanResult()
+
+    monkeypatch.setattr(scheduler, "EbayClient", FakeClient)
+    monkeypatch.setattr(scanner, "_scan_target", fake_scan_target)
+    targets = [Target(id=None, name=f"Test {idx}", query=f"test {idx}") for idx in range(6)]
+    scanner._scan_parallel(targets, workers=2)
+
+    assert len(used) == 6
+    assert 1 <= len(created) <= 2
+    assert set(map(id, used)) == set(map(id, created))
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import serve
+
+
+@pytest.fixture
+def latest(monkeypatch, tmp_path):
+    path = tmp_path / "latest.json"
+
+    def write(items, generated_at="2026-02-10T18:00:00+00:00") -> None:
+        path.write_text(json.dumps({"generated_at": generated_at, "items": items}), encoding="utf-8")
+
+    monkeypatch.setattr(serve, "LATEST_SCAN_PATH", path)
+    monkeypatch.setattr(serve, "_LATEST_SCAN_MEMO", None)
+    monkeypatch.setattr(serve, "_ENRICHED_ITEMS_MEMO", None)
+    return SimpleNamespace(write=write, client=serve.app.test_client())
+
+
+def test_dashboard_renders_from_compiled_template(latest) -> None:
+    latest.write([{"decision": "deal", "title": "Switch OLED", "deal_score": 40, "url": "https://www.ebay.co.uk/itm/1"}])
+
+    first = latest.client.get("/")
+    assert first.status_code == 200
+    assert "Switch OLED" in first.get_data(as_text=True)
+    template = serve.app.jinja_env.get_template("dashboard.html")
+    assert latest.client.get("/").status_code == 200
+    assert serve.app.jinja_env.get_template("dashboard.html") is template
+
+
+def test_export_csv_streams_sorted_rows(latest) -> None:
+    latest.write(
+        [
+            {"decision": "ignore", "title": "A", "deal_score": 5, "reasons": []},
+            {"decision": "deal", "title": "C Phone", "deal_score": 50, "reasons": ["cheap", "fast"]},
+        ]
+    )
+
+    response = latest.client.get("/api/export/csv")
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.headers["Content-Disposition"] == "attachment; filename=keyflip_scan.csv"
+    lines = response.get_data(as_text=True).splitlines()
+    assert lines[0].startswith("decision,title,url")
+    assert lines[1].startswith("deal,C Phone")
+    assert lines[1].endswith("cheap; fast")
+    assert lines[2].startswith("ignore,A")
+
+
+def test_latest_scan_is_reparsed_only_when_file_changes(monkeypatch, latest) -> None:
+    latest.write([])
+    calls: list[int] = []
+    real_load = serve.load_latest_scan
+
+    def counting_load(path):
+        calls.append(1)
+        return real_load(path)
+
+    monkeypatch.setattr(serve, "load_latest_scan", counting_load)
+
+    assert latest.client.get("/api/health").get_json()["items_count"] == 0
+    assert latest.client.get("/api/health").get_json()["items_count"] == 0
+    assert len(calls) == 1
+
+    latest.write([{"title": "Phone"}], generated_at="2026-02-10T19:00:00+00:00")
+    assert latest.client.get("/api/health").get_json()["items_count"] == 1
+    assert len(calls) == 2
+
+
+def test_latest_scan_missing_file_returns_no_data(latest) -> None:
+    response = latest.client.get("/api/health")
+    assert response.get_json()["status"] == "no_data"
+
+
+def test_enriched_items_reused_until_payload_or_target_changes(monkeypatch, latest) -> None:
+    latest.write([{"decision": "deal", "title": "Phone", "deal_score": 40, "resale_est_gbp": 200, "total_buy_gbp": 120}])
+    calls: list[float] = []
+    real_enrich = serve.enrich_items
+
+    def counting_enrich(source, settings, *, target_profit_gbp):
+        calls.append(target_profit_gbp)
+        return real_enrich(source, settings, target_profit_gbp=target_profit_gbp)
+
+    monkeypatch.setattr(serve, "enrich_items", counting_enrich)
+
+    assert latest.client.get("/api/latest?target_profit=20").get_json()["count"] == 1
+    assert latest.client.get("/api/latest?target_profit=20&q=phone").get_json()["count"] == 1
+    assert calls == [20.0]
+    latest.client.get("/api/latest?target_profit=30")
+    assert calls == [20.0, 30.0]